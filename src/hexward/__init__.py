@@ -34,6 +34,7 @@ from .hex_util import (
     cube_distance,
     cube_neighbor,
     cube_ring,
+    cube_spiral,
     cube_to_spiral,
     spiral_to_cube,
     hex_angles,
@@ -42,6 +43,9 @@ from .hex_util import (
     to_hex_point,
     CUBE_DIRECTIONS,
     DIRECTION_NAMES,
+    SQRT3,
+    SQRT3_OVER_2,
+    SQRT3_OVER_3,
 )
 
 # Version info
@@ -61,6 +65,7 @@ __all__ = [
     "cube_distance",
     "cube_neighbor",
     "cube_ring",
+    "cube_spiral",
     "cube_to_spiral",
     "spiral_to_cube",
     "hex_angles",
@@ -71,6 +76,9 @@ __all__ = [
     # Constants
     "CUBE_DIRECTIONS",
     "DIRECTION_NAMES",
+    "SQRT3",
+    "SQRT3_OVER_2",
+    "SQRT3_OVER_3",
 
     # Metadata
     "__version__",
@@ -1,7 +1,10 @@
 import math
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .hex_util import (
+    SQRT3,
+    SQRT3_OVER_2,
     GridOrientation,
     HexPoint,
     Size,
@@ -14,8 +17,61 @@ from .hex_util import (
     hex_angles,
 )
 
+if TYPE_CHECKING:
+    try:
+        import pygame
+    except ImportError:
+        # pygame not available - type hints will use string literals
+        pass
+
+
+@lru_cache(maxsize=None)
+def _corner_offsets(orientation: GridOrientation, radius: int) -> tuple[tuple[float, float], ...]:
+    """Offsets of the six corners from a hex center, computed once per orientation and radius."""
+    offsets = []
+    for angle in hex_angles(orientation.toggle()):
+        rad = math.radians(_angle_to_math_angle(angle))
+        # TODO: Does this math work for flat top?
+        offsets.append((radius * math.cos(rad), radius * math.sin(rad)))
+    return tuple(offsets)
+
+
+# Candidate colorkeys for opaque hex surfaces; at least one always differs from both the
+# fill and border colors.
+_COLORKEYS = ((255, 0, 255), (0, 255, 0), (0, 0, 255))
+
+
+def _opaque_colorkey(color: "pygame.Color", border_color: "pygame.Color") -> tuple[int, int, int] | None:
+    """Pick a colorkey for drawing a hex without per-pixel alpha.
+
+    Returns None if either color is translucent, in which case the hex needs an
+    SRCALPHA surface.
+    """
+    import pygame
+
+    color = pygame.Color(color)
+    border_color = pygame.Color(border_color)
+    if color.a != 255 or border_color.a != 255:
+        return None
+    used = {tuple(color)[:3], tuple(border_color)[:3]}
+    return next(key for key in _COLORKEYS if key not in used)
+
+
+@lru_cache(maxsize=None)
+def _cell_size(orientation: GridOrientation, radius: int) -> Size:
+    """Bounding size of a hex, shared by every cell with the same orientation and radius."""
+    size_long = 2 * radius
+    size_short = SQRT3 * radius
+    if orientation == GridOrientation.POINTY_TOP:
+        return Size(size_short, size_long)
+    return Size(size_long, size_short)
+
 
 class HexCell:
+    # Maps hold one cell per hex, so the core fields live in slots. __dict__ is kept (and only
+    # allocated once something else is assigned) so callers can still tag cells with their
+    # own attributes, and __weakref__ keeps cells weak-referenceable.
+    __slots__ = ("__dict__", "__weakref__", "_data", "_orientation", "_pixel_xy", "_point", "_radius", "_size", "_xy")
 
     # region Dunder Methods
 
@@ -24,8 +80,9 @@ class HexCell:
         self._radius = radius
         self._point = point
         self._data = data
-        self._size = Size(0, 0)
-        self._pixel_xy: tuple[int, int] | None = None
+        self._size = _cell_size(orientation, radius)
+        self._pixel_xy = self._compute_pixel_xy()
+        self._xy: tuple[int, int] | None = None
 
     def __int__(self) -> int:
         return int(self._point)
@@ -52,6 +109,7 @@ class HexCell:
     @point.setter
     def point(self, value: HexPoint) -> None:
         self._point = value
+        self.clearcache()
     
     @property
     def q(self) -> int:
@@ -79,10 +137,12 @@ class HexCell:
     
     @property
     def xy(self) -> tuple[int, int]:
-        if self.orientation == GridOrientation.POINTY_TOP:
-            return _cube_to_oddr(self._point)
-        else:
-            return _cube_to_oddq(self._point)
+        if self._xy is None:
+            if self.orientation == GridOrientation.POINTY_TOP:
+                self._xy = _cube_to_oddr(self._point.q, self._point.r)
+            else:
+                self._xy = _cube_to_oddq(self._point.q, self._point.r)
+        return self._xy
     
     @xy.setter
     def xy(self, value: tuple[int, int]) -> None:
@@ -90,6 +150,7 @@ class HexCell:
             self._point = _oddr_to_cube(value[0], value[1])
         else:
             self._point = _oddq_to_cube(value[0], value[1])
+        self.clearcache()
     
     @property
     def x(self) -> int:
@@ -105,33 +166,10 @@ class HexCell:
 
     @property
     def size(self) -> Size:
-        if not self._size:
-            size_long = 2 * self.radius
-            size_short = math.sqrt(3) * self.radius
-            if self.orientation == GridOrientation.POINTY_TOP:
-                self._size = Size(size_short, size_long)
-            else:
-                self._size = Size(size_long, size_short)
         return self._size
     
     @property
-    def pixel_xy(self) -> tuple[int, int] | None:
-        if self._pixel_xy is None:
-        
-            if self.orientation == GridOrientation.POINTY_TOP:
-                x = math.sqrt(3) * self.q + math.sqrt(3)/2 * self.r
-                y = (3 / 2) * self.r
-                # scale cartesian coordinates
-                x = x * self._radius   # (self.size.width / 2)
-                y = y * self._radius    # (self.size.height / 2)
-                self._pixel_xy = (x, y)
-            else:
-                x = (3 / 2) * self.q
-                y = math.sqrt(3)/2 * self.q + math.sqrt(3) * self.r
-                # scale cartesian coordinates
-                x = x * self._radius   # (self.size.width / 2)
-                y = y * self._radius    # (self.size.height / 2)
-                self._pixel_xy = (x, y)
+    def pixel_xy(self) -> tuple[float, float]:
         return self._pixel_xy
 
     @property
@@ -144,10 +182,27 @@ class HexCell:
 
     # endregion Properties
 
+    # region Private Methods
+
+    def _compute_pixel_xy(self) -> tuple[float, float]:
+        q = self._point.q
+        r = self._point.r
+        if self._orientation == GridOrientation.POINTY_TOP:
+            x = SQRT3 * q + SQRT3_OVER_2 * r
+            y = (3 / 2) * r
+        else:
+            x = (3 / 2) * q
+            y = SQRT3_OVER_2 * q + SQRT3 * r
+        # scale cartesian coordinates
+        return (x * self._radius, y * self._radius)
+
+    # endregion Private Methods
+
     # region Methods
 
     def clearcache(self) -> None:
-        self._pixel_xy = None
+        self._pixel_xy = self._compute_pixel_xy()
+        self._xy = None
 
 #    def draw(self, color: pygame.Color, border_color: pygame.Color , border_width: int = 1) -> pygame.Surface:
     def draw(self, color, border_color, border_width: int = 1):
@@ -160,19 +215,22 @@ class HexCell:
         surface_width = self.size.width + (2 * border_width)
         surface_height = self.size.height + (2 * border_width)
         
-        hex_surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
-        hex_surface.fill((0, 0, 0, 0))
-        
-        points = []
-        for angle in self.corner_angles:
-            math_angle = _angle_to_math_angle(angle)
-            rad = math.radians(math_angle)
-            # TODO: Does this math work for flat top?
-            # Center hex on padded surface by adding padding to coordinates
-            x = (surface_width/2) + self.radius * math.cos(rad)
-            y = (surface_height/2) + self.radius * math.sin(rad)
-            points.append((x, y))
-            
+        colorkey = _opaque_colorkey(color, border_color)
+        if colorkey is None:
+            hex_surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
+            hex_surface.fill((0, 0, 0, 0))
+        else:
+            # Opaque hexes only need the corners masked out, and RLE colorkey blits are
+            # much cheaper than per-pixel alpha blending.
+            hex_surface = pygame.Surface((surface_width, surface_height))
+            hex_surface.fill(colorkey)
+            hex_surface.set_colorkey(colorkey, pygame.RLEACCEL)
+
+        # Center hex on padded surface by adding padding to coordinates
+        center_x = surface_width/2
+        center_y = surface_height/2
+        points = [(center_x + dx, center_y + dy) for dx, dy in _corner_offsets(self.orientation, self.radius)]
+
         pygame.draw.polygon(hex_surface, color, points)
         pygame.draw.polygon(hex_surface, border_color, points, border_width)
         return hex_surface
@@ -195,42 +253,17 @@ class HexCell:
         return (x, y)
     
     def nearest_direction_from_angle(self, angle: int) -> int:
-        # Normalize angle to 0-360 range
-        
-        normalized_angle = angle % 360
-        
-        # Compare angle to each corner angle and find closest match
-        min_diff = float('inf')
-        closest_direction = 0
-        
-        for direction, corner_angle in enumerate(self.edge_angles):
-            # Calculate shortest angle difference accounting for wrapping
-            angle_diff = min(
-                abs(corner_angle - normalized_angle),
-                abs(corner_angle - (normalized_angle + 360)),
-                abs((corner_angle + 360) - normalized_angle)
-            )
-            
-            if angle_diff < min_diff:
-                min_diff = angle_diff
-                closest_direction = direction
-                
-        return closest_direction
+        # Edge angles are evenly spaced 60 degrees apart starting from the first edge,
+        # so rotate the angle onto that base and bucket it into 60 degree sextants.
+        # Angles exactly between two edges resolve to the next edge clockwise.
+        base = self.edge_angles[0]
+        return int(((angle - base + 30) % 360) // 60) % 6
 
     def nearest_corner_from_angle(self, angle: int) -> int:
-        # Normalize angle to 0-360 range
-        angle = angle % 360
-        
         # Corner angles are offset from direction angles by 30 degrees
-        direction_angles = []
-        if self.orientation == GridOrientation.POINTY_TOP:
-            direction_angles = [0, 60, 120, 180, 240, 300]
-        else:
-            direction_angles = [30, 90, 150, 210, 270, 330]
-
-        # Find direction (0-5) that minimizes angle difference
-        idx = min(range(6), key=lambda i: abs(direction_angles[i] - angle))
-        return direction_angles[idx]
+        base = self.corner_angles[0]
+        idx = int(((angle - base + 30) % 360) // 60) % 6
+        return (base + 60 * idx) % 360
 
     # endregion Methods
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import math
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
-from .hex_util import GridOrientation, HexPoint, Size, cube_round, cube_ring, to_hex_point
+from .hex_util import SQRT3_OVER_3, GridOrientation, HexPoint, Size, _point_key, cube_round, cube_spiral, to_hex_point
 from .hex_cell import HexCell
 
 if TYPE_CHECKING:
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
         # pygame not available - type hints will use string literals
         pass
 
+# Most draw styles kept rendered per map; the least recently used style is dropped first.
+_SURFACE_CACHE_SIZE = 16
+
 
 # TODO: Add things so we can do map[point] and for cell in map.
 # TODO: Proper exceptions for when acting on an invalid cell (like pixel_to_hex)
@@ -23,20 +26,38 @@ class HexMap:
     def __init__(self, radius: int = 100, orientation: GridOrientation = GridOrientation.POINTY_TOP, cell_type: type[HexCell] = HexCell):
         self._orientation = orientation
         self._radius = radius
-        self._grid: dict[HexPoint, HexCell] = {}
+        # Cells are keyed on plain (q, r, s) tuples, which hash faster than HexPoints and
+        # let callers probe with HexPoint.neighbor_coords() without allocating points.
+        self._grid: dict[tuple[int, int, int], HexCell] = {}
         self._spacing = Size(0, 0)
         self._reference = HexCell(orientation, HexPoint(0, 0, 0), radius)
         self._offset = Size(0, 0)
         self._cell_type = cell_type
+        self._pixel_cache: tuple[list[float], list[float]] | None = None
+        self._surface_cache: dict[tuple, "pygame.Surface"] = {}
+
+        # Inverse of the hex-to-pixel transform, used by pixel_to_hex
+        if orientation == GridOrientation.POINTY_TOP:
+            self._m00, self._m01 = SQRT3_OVER_3, -1 / 3
+            self._m10, self._m11 = 0.0, 2 / 3
+        else:
+            self._m00, self._m01 = 2 / 3, 0.0
+            self._m10, self._m11 = -1 / 3, SQRT3_OVER_3
 
     def __contains__(self, item: object) -> bool:
+        if isinstance(item, tuple):
+            # Same validation as to_hex_point, without building a HexPoint
+            return len(item) == 3 and all(isinstance(v, int) for v in item) and item in self._grid
         point = to_hex_point(item)
         if point is None:
             return False
-        return point in self._grid
+        return point._key in self._grid
     
-    def __getitem__(self, point: HexPoint) -> HexCell:
-        return self._grid[point]
+    def __getitem__(self, point: HexPoint | tuple[int, int, int]) -> HexCell:
+        key = _point_key(point)
+        if key is None:
+            raise KeyError(point)
+        return self._grid[key]
 
     def __iter__(self):
         return iter(self._grid.values())
@@ -87,18 +108,43 @@ class HexMap:
         x = (target_x - self.radius) / self._radius
         y = (target_y) / self._radius
 
-        q = math.sqrt(3)/3 * x - (1/3) * y
-        r = (2 / 3) * y
+        q = self._m00 * x + self._m01 * y
+        r = self._m10 * x + self._m11 * y
         return cube_round(q, r)
 
     def _pixel_to_flat_hex(self, target_x: int, target_y: int) -> HexPoint:
         x = target_x / (self.size.width / 2)
         y = target_y / (self.size.height / 2)
 
-        q = (2 / 3) * x
-        r = (-1 / 3) * x + math.sqrt(3) / 3 * y
+        q = self._m00 * x + self._m01 * y
+        r = self._m10 * x + self._m11 * y
         return cube_round(q, r)
 
+    def _pixel_coords(self) -> tuple[list[float], list[float]]:
+        """Return the x and y pixel centers of every cell, in grid order.
+
+        Built in a single pass over the grid and cached until the set of cells changes.
+        """
+        if self._pixel_cache is None:
+            pixels = [cell.pixel_xy for cell in self._grid.values()]
+            self._pixel_cache = ([x for x, _ in pixels], [y for _, y in pixels])
+        return self._pixel_cache
+
+    def _hex_surface(self, color: "pygame.Color", border_color: "pygame.Color", border_width: int) -> "pygame.Surface":
+        """Return the reference hex drawn with the given style, keeping recent styles rasterized."""
+        import pygame
+
+        key = (tuple(pygame.Color(color)), tuple(pygame.Color(border_color)), border_width)
+        cache = self._surface_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = self._reference.draw(color, border_color, border_width)
+            if len(cache) >= _SURFACE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # (Re)insert so dict order tracks recency
+        cache[key] = surface
+        return surface
+
     # endregion Private Methods
 
     # region Public methods
@@ -110,34 +156,50 @@ class HexMap:
         else:
             return self._pixel_to_flat_hex(x, y)
 
+    def pixel_to_hex_batch(self, xs: Iterable[int], ys: Iterable[int]) -> list[HexPoint]:
+        """Convert many pixel positions to hexes, resolving the offset and orientation once."""
+        offset_x, offset_y = self._offset
+        if self.orientation == GridOrientation.POINTY_TOP:
+            convert = self._pixel_to_pointy_hex
+        else:
+            convert = self._pixel_to_flat_hex
+        return [convert(x - offset_x, y - offset_y) for x, y in zip(xs, ys, strict=True)]
+
     def set(self, point: HexPoint, data: Any = None) -> HexCell:
         if isinstance(data, HexCell):
             data = data.data
         if isinstance(point, tuple):
             point = HexPoint(*point)
 
-        self._grid[point] = self._cell_type(self.orientation, point, self.radius, data)
-        return self._grid[point]
+        cell = self._cell_type(self.orientation, point, self.radius, data)
+        self._grid[point._key] = cell
+        self._pixel_cache = None
+        return cell
 
-    def get(self, point: HexPoint) -> HexCell:
-        return self._grid[point]
+    def get(self, point: HexPoint | tuple[int, int, int]) -> HexCell:
+        return self[point]
     
-    def remove(self, point: HexPoint):
-        self._grid.pop(point, None)
+    def remove(self, point: HexPoint | tuple[int, int, int]):
+        key = _point_key(point)
+        if key is None:
+            return
+        if self._grid.pop(key, None) is not None:
+            self._pixel_cache = None
     
     def swap(self, point1: HexPoint, point2: HexPoint):
         if point1 not in self or point2 not in self:
             raise ValueError("One or both points are not in the map")
         
-        self._grid[point1].data, self._grid[point2].data = self._grid[point2].data, self._grid[point1].data
-        self._grid[point1].clearcache()
-        self._grid[point2].clearcache()
+        cell1 = self[point1]
+        cell2 = self[point2]
+        cell1.data, cell2.data = cell2.data, cell1.data
 
-    def fill_to_radius(self, radius: int):
-        for i in range(radius):
-            for point in cube_ring(HexPoint(0, 0, 0), i):
-                if point not in self:
-                    self.set(point, None)
+    def fill_to_radius(self, radius: int) -> None:
+        if radius <= 0:
+            return
+        for key in cube_spiral((0, 0, 0), radius - 1):
+            if key not in self._grid:
+                self.set(HexPoint(*key), None)
 
     def draw(self, color: "pygame.Color | None" = None, border_color: "pygame.Color | None" = None, border_width: int = 1) -> "pygame.Surface":
         try:
@@ -159,10 +221,9 @@ class HexMap:
             return empty_surface
 
         # Calculate bounds of grid
-        min_x = min(cell.pixel_xy[0] for cell in self._grid.values())
-        max_x = max(cell.pixel_xy[0] for cell in self._grid.values()) 
-        min_y = min(cell.pixel_xy[1] for cell in self._grid.values())
-        max_y = max(cell.pixel_xy[1] for cell in self._grid.values())
+        xs, ys = self._pixel_coords()
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
 
         # Calculate the offset needed to make all coordinates positive
         # We need to ensure the leftmost/topmost hex has enough space for its full width/height
@@ -179,15 +240,21 @@ class HexMap:
         grid_surface.fill((0, 0, 0, 0))
 
         # Draw each cell offset by min_x/y to align with surface
-        for cell in self._grid.values():
-            hex_surface = cell.draw(color, border_color, border_width)
-
-            # Calculate position relative to the grid surface with proper offset
-            # pixel_xy gives us the center point, so we need to offset by the hex surface size
-            x = int(cell.pixel_xy[0] + offset_x - hex_surface.get_width()/2)
-            y = int(cell.pixel_xy[1] + offset_y - hex_surface.get_height()/2)
-            
-            grid_surface.blit(hex_surface, (x, y))
+        # pixel_xy gives us the center point, so we need to offset by the hex surface size
+        if self._cell_type.draw is HexCell.draw:
+            # Plain cells all look identical, so blit the one cached surface everywhere.
+            hex_surface = self._hex_surface(color, border_color, border_width)
+            hex_width, hex_height = hex_surface.get_size()
+            blit_xs = [int(pixel_x + offset_x - hex_width/2) for pixel_x in xs]
+            blit_ys = [int(pixel_y + offset_y - hex_height/2) for pixel_y in ys]
+            grid_surface.blits([(hex_surface, (x, y)) for x, y in zip(blit_xs, blit_ys)], doreturn=False)
+        else:
+            # Custom cells may draw surfaces of any size, so position each by its own surface
+            for cell, pixel_x, pixel_y in zip(self._grid.values(), xs, ys):
+                cell_surface = cell.draw(color, border_color, border_width)
+                x = int(pixel_x + offset_x - cell_surface.get_width()/2)
+                y = int(pixel_y + offset_y - cell_surface.get_height()/2)
+                grid_surface.blit(cell_surface, (x, y))
 
         return grid_surface
 
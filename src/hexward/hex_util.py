@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+import math
+from collections.abc import Iterator
 from enum import Enum, auto
+from functools import lru_cache
 from typing import NamedTuple
 
-# TODO: Considering caching sqrt(3) since it's used in many places
 # TODO: Add easy conversion from math degrees?
 
+SQRT3 = math.sqrt(3.0)
+SQRT3_OVER_2 = SQRT3 * 0.5
+SQRT3_OVER_3 = SQRT3 / 3.0
+
 DIRECTION_NAMES = {
     0: "East",
     30: "Southeast",
@@ -21,6 +26,9 @@ DIRECTION_NAMES = {
     360: "East",
 }
 
+# DIRECTION_NAMES indexed by angle // 30
+_DIRECTION_NAMES_TUPLE = tuple(DIRECTION_NAMES[angle] for angle in range(0, 361, 30))
+
 class Size(NamedTuple):
     width: int
     height: int
@@ -28,11 +36,36 @@ class Size(NamedTuple):
     def __bool__(self):
         return self.width > 0 and self.height > 0
 
-@dataclass
 class HexPoint:
+    __slots__ = ("_hash", "_int", "_key", "q", "r", "s")
+    __match_args__ = ("q", "r", "s")
+
     q: int
     r: int
     s: int
+    _key: tuple[int, int, int]
+    _hash: int | None
+    _int: int | None
+
+    def __init__(self, q: int, r: int, s: int) -> None:
+        # Points are immutable: _key backs equality and map storage, and _hash/_int are
+        # filled lazily by __hash__ and __int__, so none of them can go stale.
+        _set = object.__setattr__
+        _set(self, "q", q)
+        _set(self, "r", r)
+        _set(self, "s", s)
+        _set(self, "_key", (q, r, s))
+        _set(self, "_hash", None)
+        _set(self, "_int", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable; cannot delete {name!r}")
+
+    def __reduce__(self) -> tuple[type['HexPoint'], tuple[int, int, int]]:
+        return (self.__class__, self._key)
 
     def __add__(self, other: 'HexPoint') -> 'HexPoint':
         return HexPoint(self.q + other.q, self.r + other.r, self.s + other.s)
@@ -46,7 +79,14 @@ class HexPoint:
         elif isinstance(other, int):
             return HexPoint(self.q * other, self.r * other, self.s * other)
         return NotImplemented
-    
+
+    def _scaled(self, k: int) -> 'HexPoint':
+        """Scalar multiply without the type dispatch in __mul__."""
+        return HexPoint(self.q * k, self.r * k, self.s * k)
+
+    # Points are ordered by spiral index (see cube_to_spiral): ring by ring outward from
+    # the origin, walking each ring in cube_ring order. The index is O(1) to compute and
+    # cached per point, so sorting stays O(N log N).
     def __lt__(self, other: 'HexPoint') -> bool:
         return int(self) < int(other)
     
@@ -60,15 +100,18 @@ class HexPoint:
         return int(self) >= int(other)
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if isinstance(other, HexPoint):
-            return self.q == other.q and self.r == other.r and self.s == other.s
+            return self._key == other._key
         return NotImplemented
 
     def __int__(self) -> int:
-        if hasattr(self, '_int'):
-            return self._int
-        self._int = cube_to_spiral(self)
-        return self._int
+        index = self._int
+        if index is None:
+            index = cube_to_spiral(self)
+            object.__setattr__(self, "_int", index)
+        return index
     
     def __repr__(self) -> str:
         return f"HexPoint(q={self.q}, r={self.r}, s={self.s})"
@@ -77,12 +120,21 @@ class HexPoint:
         return f"(q={self.q}, r={self.r}, s={self.s})"
     
     def __hash__(self) -> int:
-        return hash((self.q, self.r, self.s))
+        value = self._hash
+        if value is None:
+            value = hash(self._key)
+            object.__setattr__(self, "_hash", value)
+        return value
 
     @property
     def neighbors(self) -> list['HexPoint']:
         return [self + direction for direction in CUBE_DIRECTIONS]
 
+    def neighbor_coords(self) -> tuple[tuple[int, int, int], ...]:
+        """Return the six neighboring coordinates as plain (q, r, s) tuples, without building HexPoints."""
+        q, r, s = self.q, self.r, self.s
+        return tuple((q + dq, r + dr, s + ds) for dq, dr, ds in _CUBE_DIRS_TUPLES)
+
 
 CUBE_DIRECTIONS = [
     HexPoint(1, 0, -1),
@@ -93,14 +145,32 @@ CUBE_DIRECTIONS = [
     HexPoint(1, -1, 0),
 ]
 
+_CUBE_DIRS_TUPLES = tuple((d.q, d.r, d.s) for d in CUBE_DIRECTIONS)
+
 class GridOrientation(Enum):
     POINTY_TOP = auto()
     FLAT_TOP = auto()
 
     def toggle(self) -> 'GridOrientation':
-        if self == GridOrientation.POINTY_TOP:
-            return GridOrientation.FLAT_TOP
-        return GridOrientation.POINTY_TOP
+        return _TOGGLED_ORIENTATION[self]
+
+_TOGGLED_ORIENTATION = {
+    GridOrientation.POINTY_TOP: GridOrientation.FLAT_TOP,
+    GridOrientation.FLAT_TOP: GridOrientation.POINTY_TOP,
+}
+
+def _point_key(point: object) -> tuple[int, int, int] | None:
+    """Return the plain (q, r, s) tuple used to key map storage.
+
+    Non-tuple values are normalized through to_hex_point; returns None if the value
+    does not describe a hex.
+    """
+    if isinstance(point, tuple):
+        return point
+    hex_point = to_hex_point(point)
+    if hex_point is None:
+        return None
+    return hex_point._key
 
 # TODO: Find places still doing this themselves instead of calling here.
 def _angle_to_math_angle(angle: int) -> int:
@@ -109,43 +179,68 @@ def _angle_to_math_angle(angle: int) -> int:
 def _math_angle_to_angle(angle: int) -> int:
     return (-1 * (angle + 90)) % 360
 
-def _cube_to_oddr(q, r, s) -> tuple[int, int]:
+def _cube_to_oddr(q, r) -> tuple[int, int]:
     """Convert cube coordinates to offset coordinates for pointy top orientation"""
     parity = r % 2
-    col = q + (r - parity) / 2
+    col = q + (r - parity) // 2
     row = r
     return col, row
 
 def _oddr_to_cube(x, y) -> HexPoint:
     """Convert offset coordinates to cube coordinates for pointy top orientation"""
-    parity = x % 2
-    q = y - (x - parity) / 2
-    r = x
+    parity = y % 2
+    q = x - (y - parity) // 2
+    r = y
     return HexPoint(q, r, -q-r)
 
 
-def _cube_to_oddq(q, r, s) -> tuple[int, int]:
+def _cube_to_oddq(q, r) -> tuple[int, int]:
     """Convert cube coordinates to offset coordinates for flat top orientation"""
     parity = q % 2
     col = q
-    row = r + (q - parity) / 2
+    row = r + (q - parity) // 2
     return col, row
 
 def _oddq_to_cube(x, y) -> HexPoint:
     """Convert offset coordinates to cube coordinates for flat top orientation"""
     parity = x % 2
     q = x
-    r = y - (x - parity) / 2
+    r = y - (x - parity) // 2
     return HexPoint(q, r, -q-r)
 
 def cube_distance(a: HexPoint, b: HexPoint) -> int:
-    return (abs(a.q - b.q) + abs(a.r - b.r) + abs(a.s - b.s)) // 2
+    # s is implied by q + r + s == 0, so the s difference is just -(dq + dr).
+    dq = a.q - b.q
+    dr = a.r - b.r
+    return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
 
 
 def cube_neighbor(hex: HexPoint, direction: int) -> 'HexPoint':
     return hex + CUBE_DIRECTIONS[direction]
 
 
+@lru_cache(maxsize=128)
+def _cube_ring_origin(radius: int) -> tuple[tuple[int, int, int], ...]:
+    """Return the (q, r, s) coordinates <radius> distance from the origin, memoized per radius.
+
+    Plain int tuples are cached rather than HexPoints so callers always get fresh points.
+    """
+    if radius == 0:
+        return ((0, 0, 0),)
+
+    results = []
+
+    q, r, s = CUBE_DIRECTIONS[4]._scaled(radius)._key
+
+    for dq, dr, ds in _CUBE_DIRS_TUPLES:
+        for _ in range(radius):
+            results.append((q, r, s))
+            q += dq
+            r += dr
+            s += ds
+    return tuple(results)
+
+
 def cube_ring(center: HexPoint, radius: int) -> list['HexPoint']:
     """ Return a list of cells that are <radius> distance from the center."""
     if radius < 0:
@@ -153,15 +248,9 @@ def cube_ring(center: HexPoint, radius: int) -> list['HexPoint']:
     if radius == 0:
         return [center]
 
-    results = []
-
-    point = center + (CUBE_DIRECTIONS[4] * radius)
-
-    for i in range(6):
-        for _ in range(radius):
-            results.append(point)
-            point = cube_neighbor(point, i)
-    return results
+    ring = _cube_ring_origin(radius)
+    cq, cr, cs = center.q, center.r, center.s
+    return [HexPoint(cq + q, cr + r, cs + s) for q, r, s in ring]
 
 
 def _spiral_index_start_of_ring(radius: int) -> int:
@@ -178,32 +267,76 @@ def _spiral_index_to_radius(index: int) -> int:
     return int((3 + (9 + 12*(index-1))**0.5) / 6)
 
 
+def cube_spiral(center: HexPoint | tuple[int, int, int], max_radius: int) -> Iterator[tuple[int, int, int]]:
+    """Yield the (q, r, s) coordinates of every cell within <max_radius> of the center.
+
+    Cells are visited ring by ring outward, each ring in cube_ring order, without
+    building intermediate ring lists or HexPoints.
+    """
+    if max_radius < 0:
+        raise ValueError("Radius must be positive")
+    cq, cr, cs = center if isinstance(center, tuple) else center._key
+    yield (cq, cr, cs)
+
+    sq, sr, ss = _CUBE_DIRS_TUPLES[4]
+    for radius in range(1, max_radius + 1):
+        q, r, s = cq + sq * radius, cr + sr * radius, cs + ss * radius
+        for dq, dr, ds in _CUBE_DIRS_TUPLES:
+            for _ in range(radius):
+                yield (q, r, s)
+                q += dq
+                r += dr
+                s += ds
+
+
+def _ring_index(q: int, r: int, s: int, radius: int) -> int:
+    """Position of (q, r, s) within the ring returned by cube_ring at <radius>.
+
+    The ring starts at (0, -radius, radius) and walks its six edges in CUBE_DIRECTIONS
+    order, so the index is the edge number times the radius plus the offset along it.
+    """
+    if r == -radius and q < radius:
+        return q
+    if q == radius and s > -radius:
+        return radius - s
+    if s == -radius and r < radius:
+        return 2 * radius + r
+    if r == radius and q > -radius:
+        return 3 * radius - q
+    if q == -radius and s < radius:
+        return 4 * radius + s
+    return 5 * radius - r
+
+
 def cube_to_spiral(point: HexPoint):
-    center = HexPoint(0, 0, 0)
-    radius = cube_distance(point, center)
-    ring_hexes = cube_ring(center, radius)
-    for i, ring_hex in enumerate(ring_hexes):
-        if point == ring_hex:
-            return i + _spiral_index_start_of_ring(radius)
-    raise ValueError("Hex not found in ring")
+    q, r, s = point.q, point.r, point.s
+    if q + r + s != 0:
+        raise ValueError("Hex not found in ring")
+    radius = (abs(q) + abs(r) + abs(s)) // 2
+    return _spiral_index_start_of_ring(radius) + _ring_index(q, r, s, radius)
 
 def spiral_to_cube(index: int) -> HexPoint:
-    center = HexPoint(0, 0, 0)
     radius = _spiral_index_to_radius(index)
     ringstart = _spiral_index_start_of_ring(radius)
-    return cube_ring(center, radius)[index - ringstart]
-
-def hex_angles(orientation: GridOrientation) -> tuple[int, int, int, int, int, int]:
-    if orientation == GridOrientation.POINTY_TOP:
-        return (90, 150, 210, 270, 330, 30)
+    return HexPoint(*_cube_ring_origin(radius)[index - ringstart])
 
+_HEX_ANGLES = {
+    GridOrientation.POINTY_TOP: (90, 150, 210, 270, 330, 30),
     # TODO: Make sure this order is correct.
-    return (0, 60, 120, 180, 240, 300)
+    GridOrientation.FLAT_TOP: (0, 60, 120, 180, 240, 300),
+}
+
+def hex_angles(orientation: GridOrientation) -> tuple[int, int, int, int, int, int]:
+    return _HEX_ANGLES[orientation]
 
 def direction_name(angle: int) -> str:
-    if angle in DIRECTION_NAMES:
-        return DIRECTION_NAMES[angle]
-    raise ValueError(f"Invalid angle: {angle}")
+    try:
+        step, remainder = divmod(angle, 30)
+    except TypeError:
+        raise ValueError(f"Invalid angle: {angle}") from None
+    if remainder or not 0 <= step <= 12:
+        raise ValueError(f"Invalid angle: {angle}")
+    return _DIRECTION_NAMES_TUPLE[int(step)]
 
 def cube_round(frac_q: float, frac_r: float, frac_s: float | None = None) -> HexPoint:
 